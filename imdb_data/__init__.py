@@ -0,0 +1,10 @@
+#
+# Re-formats the IMDb data set files into normalized csv files, and
+# samples those csv files. See the "process" and "sample" modules, or
+# run "python -m imdb_data --help".
+#
+
+from .process import run as process_files
+from .sample import sample_sizes, sample_titles
+from .closure import sample_closure
+from .lookup import Lookup, build_indexes
@@ -0,0 +1,61 @@
+#
+# Microbenchmarks for the lookup indexes: the time taken to open them, and
+# to answer each kind of lookup, for a random selection of keys taken from
+# the indexes themselves.
+#
+
+import random
+import time
+
+from .lookup import Lookup, header, record
+
+lookups = 2000
+range_size = 100
+
+# --------------------------------------------------------------------------
+
+def sample_ids(index, prefix, count, rand):
+    ids = []
+    for n in range(min(count, index.count)):
+        pos = header.size + rand.randrange(index.count) * record.size
+        key = record.unpack_from(index.mm, pos)[0]
+        ids.append(prefix + str(key).zfill(7))
+    return ids
+
+def time_calls(label, func, args_list):
+    start = time.perf_counter()
+    rows = 0
+    for args in args_list:
+        result = func(*args)
+        rows += len(result) if isinstance(result, list) else int(result is not None)
+    elapsed = time.perf_counter() - start
+    calls = max(len(args_list), 1)
+    print(f"{label:32}{elapsed / calls * 1000000:10.1f} us/op{calls / elapsed if elapsed else 0:13,.0f} ops/s"
+            f"{rows:13,} rows")
+
+# --------------------------------------------------------------------------
+
+def run(csv_dir='csv', index_dir=None, lookups=lookups, seed=1):
+    rand = random.Random(seed)
+
+    start = time.perf_counter()
+    lookup = Lookup(csv_dir, index_dir)
+    print('')
+    print(f"Open indexes (startup):         {(time.perf_counter() - start) * 1000:10.1f} ms")
+    print('')
+
+    try:
+        title_ids = sample_ids(lookup.indexes['title'], 'tt', lookups, rand)
+        talent_ids = sample_ids(lookup.indexes['talent'], 'nm', lookups, rand)
+        series_ids = sample_ids(lookup.indexes['series_episode'], 'tt', lookups, rand)
+
+        time_calls('Title by ID:', lookup.title, [(title_id,) for title_id in title_ids])
+        time_calls('Talent by ID:', lookup.talent, [(talent_id,) for talent_id in talent_ids])
+        time_calls('Principals for title:', lookup.principals, [(title_id,) for title_id in title_ids])
+        time_calls('Filmography for talent:', lookup.filmography, [(talent_id,) for talent_id in talent_ids])
+        time_calls('Episodes for series:', lookup.episodes, [(series_id,) for series_id in series_ids])
+        time_calls(f"Title range ({range_size} rows):", lookup.title_range,
+                [(title_id, 'tt9999999999', range_size) for title_id in title_ids])
+    finally:
+        lookup.close()
+    print('')
@@ -0,0 +1,180 @@
+#
+# Command line entry point for the processing and sampling stages:
+#
+#   python -m imdb_data process --src-dir . --out-dir csv
+#   python -m imdb_data process --stages title_basics title_episodes
+#   python -m imdb_data process --encode-text
+#   python -m imdb_data sample --in-dir csv --out-dir csv/sampled --sample-size 2000
+#   python -m imdb_data sample --sample-sizes 1000 10000 100000
+#   python -m imdb_data sample --mode closure --depth 3 --max-rows 50000
+#   python -m imdb_data sort --dir csv --max-lines 500000 --workers 4
+#   python -m imdb_data integrity --dir csv --action quarantine
+#   python -m imdb_data index --dir csv
+#   python -m imdb_data lookup principals tt0063562
+#   python -m imdb_data serve --port 8080
+#   python -m imdb_data bench
+#
+
+import argparse
+import json
+import os
+
+from . import bench
+from . import closure
+from . import extsort
+from . import integrity
+from . import lookup
+from . import process
+from . import sample
+from . import server
+
+# --------------------------------------------------------------------------
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError('must be at least 1: ' + value)
+    return number
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError('must be at least 0: ' + value)
+    return number
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='imdb_data',
+            description='Normalize and sample the IMDb data set files.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    proc = commands.add_parser('process',
+            help='re-format the IMDb .tsv.gz files into normalized csv files')
+    proc.add_argument('--src-dir', default='.',
+            help='directory holding the downloaded IMDb files (default: %(default)s)')
+    proc.add_argument('--out-dir', default='csv',
+            help='directory for the normalized csv files (default: %(default)s)')
+    proc.add_argument('--stages', nargs='+', choices=list(process.stages),
+            metavar='STAGE', help='stages to run, from: ' + ', '.join(process.stages)
+            + ' (default: ' + ', '.join(process.default_stages) + ')')
+    proc.add_argument('--encode-text', action='store_true',
+            help='move title_principal jobs and title_aka additional attributes to '
+            'master tables (job.csv, additional_attrs.csv), referenced by ID')
+    proc.add_argument('--integrity-action', choices=integrity.actions, default='report',
+            help='check_integrity stage: what to do with orphan rows (default: %(default)s)')
+
+    samp = commands.add_parser('sample',
+            help='write a sample of the normalized csv files')
+    samp.add_argument('--in-dir', default='csv',
+            help='directory holding the normalized csv files (default: %(default)s)')
+    samp.add_argument('--out-dir', default=os.path.join('csv', 'sampled'),
+            help='directory for the sampled csv files (default: %(default)s)')
+    samp.add_argument('--sample-size', type=positive_int,
+            help='approx. number of titles to sample (default: ' + str(sample.sample_size) + ')')
+    samp.add_argument('--sample-sizes', type=positive_int, nargs='+', metavar='SIZE',
+            help='stride mode: write nested samples of each size, to <out-dir>/<size>')
+    samp.add_argument('--series-thresh', type=int,
+            help='stride mode: max. number of episodes whose series are added (default: '
+            + str(sample.series_thresh) + ')')
+    samp.add_argument('--mode', choices=['stride', 'closure'], default='stride',
+            help='"stride" keeps only direct children of the sampled titles; "closure" '
+            'follows title/talent and episode/series links (default: %(default)s)')
+    samp.add_argument('--depth', type=non_negative_int, default=closure.depth,
+            help='closure mode: number of link hops from the sampled titles (default: %(default)s)')
+    samp.add_argument('--max-rows', type=positive_int, default=closure.max_rows,
+            help='closure mode: max. number of title plus talent records (default: no limit)')
+
+    srt = commands.add_parser('sort',
+            help='sort the large link csv files by their primary keys, in place')
+    srt.add_argument('--dir', default='csv',
+            help='directory holding the normalized csv files (default: %(default)s)')
+    srt.add_argument('--files', nargs='+', choices=list(extsort.sort_keys),
+            metavar='FILE', help='files to sort, from: ' + ', '.join(extsort.sort_keys)
+            + ' (default: all)')
+    srt.add_argument('--tmp-dir',
+            help='directory for the temporary run files (default: alongside each file)')
+    srt.add_argument('--max-lines', type=positive_int, default=extsort.max_lines,
+            help='max. rows per sorted run - up to (workers + 1) times this many rows '
+            'are held in memory (default: %(default)s)')
+    srt.add_argument('--workers', type=positive_int, default=extsort.workers,
+            help='worker processes sorting the runs (default: %(default)s)')
+
+    chk = commands.add_parser('integrity',
+            help='find link rows referring to titles or talent which do not exist')
+    chk.add_argument('--dir', default='csv',
+            help='directory holding the normalized csv files (default: %(default)s)')
+    chk.add_argument('--action', choices=integrity.actions, default='report',
+            help='what to do with orphan rows (default: %(default)s)')
+    chk.add_argument('--orphan-dir',
+            help='quarantine directory for orphan rows (default: <dir>/orphans)')
+
+    idx = commands.add_parser('index',
+            help='build the lookup indexes over the normalized csv files')
+    look = commands.add_parser('lookup',
+            help='look up a title, talent, or their related rows, as JSON')
+    look.add_argument('kind', choices=['title', 'talent', 'principals', 'filmography', 'episodes'])
+    look.add_argument('id', help='title or talent ID, e.g. tt0063562 or nm0000080')
+    srv = commands.add_parser('serve',
+            help='serve lookups over HTTP, on the local machine')
+    srv.add_argument('--host', default=server.host,
+            help='address to listen on (default: %(default)s)')
+    srv.add_argument('--port', type=int, default=server.port,
+            help='port to listen on (default: %(default)s)')
+    bch = commands.add_parser('bench',
+            help='run microbenchmarks over the lookup indexes')
+    bch.add_argument('--lookups', type=int, default=bench.lookups,
+            help='number of lookups of each kind (default: %(default)s)')
+    for sub in [idx, look, srv, bch]:
+        sub.add_argument('--dir', default='csv',
+                help='directory holding the normalized csv files (default: %(default)s)')
+        sub.add_argument('--index-dir',
+                help='directory for the index files (default: <dir>/index)')
+
+    return parser
+
+# --------------------------------------------------------------------------
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'sample' and args.mode == 'closure' and args.sample_sizes:
+        parser.error('--sample-sizes is only supported in stride mode')
+    if args.command == 'sample' and args.mode == 'closure' and args.series_thresh is not None:
+        parser.error('--series-thresh is only supported in stride mode')
+    if args.command == 'sample' and args.sample_size and args.sample_sizes:
+        parser.error('use either --sample-size or --sample-sizes, not both')
+    if args.command == 'sample' and args.sample_size is None:
+        args.sample_size = sample.sample_size
+    if args.command == 'sample' and args.series_thresh is None:
+        args.series_thresh = sample.series_thresh
+
+    if args.command == 'process':
+        process.run(args.src_dir, args.out_dir, args.stages, args.encode_text,
+                args.integrity_action)
+    elif args.command == 'sample' and args.mode == 'closure':
+        closure.sample_closure(args.in_dir, args.out_dir, sample_size=args.sample_size,
+                depth=args.depth, max_rows=args.max_rows)
+    elif args.command == 'sample' and args.sample_sizes:
+        sample.sample_sizes(args.in_dir, args.out_dir,
+                sizes=args.sample_sizes, series_thresh=args.series_thresh)
+    elif args.command == 'sample':
+        sample.sample_titles(args.in_dir, args.out_dir,
+                sample_size=args.sample_size, series_thresh=args.series_thresh)
+    elif args.command == 'sort':
+        extsort.sort_link_files(args.dir, args.files, args.tmp_dir,
+                max_lines=args.max_lines, workers=args.workers)
+    elif args.command == 'integrity':
+        integrity.check_integrity(args.dir, args.action, args.orphan_dir)
+    elif args.command == 'index':
+        lookup.build_indexes(args.dir, args.index_dir)
+    elif args.command == 'lookup':
+        lkp = lookup.Lookup(args.dir, args.index_dir)
+        try:
+            print(json.dumps(getattr(lkp, args.kind)(args.id), indent=2))
+        finally:
+            lkp.close()
+    elif args.command == 'serve':
+        server.serve(args.dir, args.index_dir, args.host, args.port)
+    elif args.command == 'bench':
+        bench.run(args.dir, args.index_dir, args.lookups)
+
+    return 0
@@ -0,0 +1,272 @@
+#
+# An alternative to the sampler in the "sample" module. Instead of keeping
+# only the direct children of the sampled titles, this follows the links
+# between titles and talent (and between episodes and their series) out
+# to a given depth, so that multi-hop joins in the sampled data actually
+# find rows:
+#
+#   title -> talent -> other titles for that talent -> ...
+#
+# The links are held in compact CSR-style ("compressed sparse row") integer
+# arrays: for node n, its neighbours are adjacent[offsets[n]:offsets[n + 1]].
+# Nodes are numbered by their position in the sorted list of numeric IDs
+# (the digits of "tt0063562" and "nm0000080").
+#
+# Any link which refers to a title or talent not present in title.csv or
+# talent.csv is ignored. Link rows are only written to the sample when both
+# ends are in the sample, and an episode is never sampled without its series.
+#
+
+import io
+import os
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+from .ids import id_num
+from .sample import copy_ref_files, sample_size
+
+# -----------------------------------------------------
+# Defaults. The depth is the number of link hops taken
+# from the seed titles (an episode's series does not
+# count as a hop). The row budget is the max. number of
+# title plus talent records - None means no limit.
+#
+depth = 2
+max_rows = None
+# -----------------------------------------------------
+
+Graph = namedtuple('Graph', [
+    'title_keys', 'talent_keys',              # sorted numeric IDs
+    'title_talent', 'talent_title',           # (offsets, adjacent) pairs
+    'series_episodes', 'episode_series'])     # ditto, and a parent array
+
+# --------------------------------------------------------------------------
+
+# -1 if the key is not found:
+def index_of(keys, key):
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        return i
+    return -1
+
+# --------------------------------------------------------------------------
+
+# The title and talent files are normally already in ID order, so they are
+# only sorted (through a temporary list) if they are found not to be.
+def read_keys(fname):
+    keys = array('i')
+    in_order = True
+    with io.open(fname, mode='r', encoding='utf-8') as in_f:
+        next(in_f)
+        for line in in_f:
+            num = id_num(line[:line.index(',')])
+            if keys and num < keys[-1]:
+                in_order = False
+            keys.append(num)
+    return keys if in_order else array('i', sorted(keys))
+
+# --------------------------------------------------------------------------
+
+# Reads one link file into 2 parallel arrays of node indexes. The "swap" flag
+# is for files where the talent ID comes before the title ID.
+def read_links(fname, title_keys, talent_keys, swap, sources, targets):
+    i = 0
+    with io.open(fname, mode='r', encoding='utf-8') as in_f:
+        next(in_f)
+        for line in in_f:
+            fields = line.split(',', 2)
+            title_id, talent_id = fields[0], fields[1].strip()
+            if swap:
+                title_id, talent_id = talent_id, title_id
+            title = index_of(title_keys, id_num(title_id))
+            talent = index_of(talent_keys, id_num(talent_id))
+            if title >= 0 and talent >= 0:
+                i += 1
+                sources.append(title)
+                targets.append(talent)
+    return i
+
+# --------------------------------------------------------------------------
+
+# A counting sort of the (source, target) pairs by source.
+def build_csr(sources, targets, node_count):
+    offsets = array('q', bytes(8 * (node_count + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for n in range(node_count):
+        offsets[n + 1] += offsets[n]
+
+    adjacent = array('i', bytes(4 * len(sources)))
+    fill = array('q', offsets)
+    for source, target in zip(sources, targets):
+        adjacent[fill[source]] = target
+        fill[source] += 1
+    return offsets, adjacent
+
+def neighbours(csr, n):
+    offsets, adjacent = csr
+    return adjacent[offsets[n]:offsets[n + 1]]
+
+# --------------------------------------------------------------------------
+
+def build_graph(in_dir='csv'):
+    title_keys = read_keys(os.path.join(in_dir, 'title.csv'))
+    talent_keys = read_keys(os.path.join(in_dir, 'talent.csv'))
+    print(f"Indexed titles:                 {len(title_keys):13,}")
+    print(f"Indexed talent:                 {len(talent_keys):13,}")
+
+    titles = array('i')
+    talent = array('i')
+    i = read_links(os.path.join(in_dir, 'talent_title.csv'), title_keys, talent_keys, True, titles, talent)
+    print(f"Indexed talent titles:          {i:13,}")
+    i = read_links(os.path.join(in_dir, 'title_principal.csv'), title_keys, talent_keys, False, titles, talent)
+    print(f"Indexed title principals:       {i:13,}")
+
+    title_talent = build_csr(titles, talent, len(title_keys))
+    talent_title = build_csr(talent, titles, len(talent_keys))
+    del titles, talent
+
+    episode_series = array('i', [-1]) * len(title_keys)
+    series = array('i')
+    episodes = array('i')
+    with io.open(os.path.join(in_dir, 'title_episode.csv'), mode='r', encoding='utf-8') as in_f:
+        next(in_f)
+        for line in in_f:
+            fields = line.split(',', 2)
+            episode = index_of(title_keys, id_num(fields[0]))
+            parent = index_of(title_keys, id_num(fields[1]))
+            if episode >= 0 and parent >= 0:
+                episode_series[episode] = parent
+                series.append(parent)
+                episodes.append(episode)
+    print(f"Indexed title episodes:         {len(episodes):13,}")
+
+    series_episodes = build_csr(series, episodes, len(title_keys))
+
+    return Graph(title_keys, talent_keys, title_talent, talent_title,
+            series_episodes, episode_series)
+
+# --------------------------------------------------------------------------
+
+# Breadth-first search out from the seed titles. Returns 2 bytearrays, flagging
+# which title and talent nodes are in the sample.
+def closure(graph, seeds, depth=depth, max_rows=max_rows):
+    title_seen = bytearray(len(graph.title_keys))
+    talent_seen = bytearray(len(graph.talent_keys))
+    budget = [max_rows if max_rows is not None else len(title_seen) + len(talent_seen)]
+
+    def add_title(title, frontier):
+        if budget[0] <= 0:
+            return
+        # the series comes along with its episode, whatever the depth or budget:
+        while title >= 0 and not title_seen[title]:
+            title_seen[title] = 1
+            budget[0] -= 1
+            frontier.append(title)
+            title = graph.episode_series[title]
+
+    titles = []
+    for title in seeds:
+        add_title(title, titles)
+    talent = []
+
+    for hop in range(depth):
+        if budget[0] <= 0 or not (titles or talent):
+            break
+        next_titles = []
+        next_talent = []
+        for title in titles:
+            for person in neighbours(graph.title_talent, title):
+                if budget[0] <= 0:
+                    break
+                if not talent_seen[person]:
+                    talent_seen[person] = 1
+                    budget[0] -= 1
+                    next_talent.append(person)
+            for episode in neighbours(graph.series_episodes, title):
+                add_title(episode, next_titles)
+        for person in talent:
+            for title in neighbours(graph.talent_title, person):
+                add_title(title, next_titles)
+        titles = next_titles
+        talent = next_talent
+
+    return title_seen, talent_seen
+
+# --------------------------------------------------------------------------
+
+def sampled_nums(keys, seen):
+    return {keys[n] for n in range(len(keys)) if seen[n]}
+
+# Copies the header and any rows for which "keep" is true, given the split fields.
+def copy_rows(in_dir, out_dir, file_name, keep):
+    i = 0
+    with io.open(os.path.join(in_dir, file_name), mode='r', encoding='utf-8') as in_f:
+        with io.open(os.path.join(out_dir, file_name), mode='w', encoding='utf-8') as out_f:
+            out_f.write(next(in_f))
+            for line in in_f:
+                if keep(line.split(',', 2)):
+                    i += 1
+                    out_f.write(line)
+    return i
+
+# --------------------------------------------------------------------------
+
+def sample_closure(in_dir='csv', out_dir=os.path.join('csv', 'sampled'),
+        sample_size=sample_size, depth=depth, max_rows=max_rows):
+    os.makedirs(out_dir, exist_ok=True)
+
+    print('')
+    print('Starting...')
+    print('')
+
+    graph = build_graph(in_dir)
+    print('')
+
+    # seed titles are spread evenly over the source titles, as in the "sample" module:
+    sample_freq = max(round(len(graph.title_keys) / sample_size), 1)
+    seeds = range(sample_freq - 1, len(graph.title_keys), sample_freq)
+    title_seen, talent_seen = closure(graph, seeds, depth, max_rows)
+
+    title_nums = sampled_nums(graph.title_keys, title_seen)
+    talent_nums = sampled_nums(graph.talent_keys, talent_seen)
+
+    def title_kept(fields):
+        return id_num(fields[0]) in title_nums
+
+    def talent_kept(fields):
+        return id_num(fields[0]) in talent_nums
+
+    i = copy_rows(in_dir, out_dir, 'title.csv', title_kept)
+    print(f"Sampled titles:                 {i:13,}")
+    i = copy_rows(in_dir, out_dir, 'talent.csv', talent_kept)
+    print(f"Sampled talent:                 {i:13,}")
+
+    i = copy_rows(in_dir, out_dir, 'talent_title.csv', lambda fields:
+            id_num(fields[0]) in talent_nums and id_num(fields[1].strip()) in title_nums)
+    print(f"Sampled talent titles:          {i:13,}")
+    i = copy_rows(in_dir, out_dir, 'title_principal.csv', lambda fields:
+            id_num(fields[0]) in title_nums and id_num(fields[1].strip()) in talent_nums)
+    print(f"Sampled title principals:       {i:13,}")
+    i = copy_rows(in_dir, out_dir, 'title_episode.csv', lambda fields:
+            id_num(fields[0]) in title_nums and id_num(fields[1].strip()) in title_nums)
+    print(f"Sampled title episodes:         {i:13,}")
+
+    i = copy_rows(in_dir, out_dir, 'talent_role.csv', talent_kept)
+    print(f"Sampled talent roles:           {i:13,}")
+    i = copy_rows(in_dir, out_dir, 'title_aka.csv', title_kept)
+    print(f"Sampled title akas:             {i:13,}")
+    i = copy_rows(in_dir, out_dir, 'title_aka_title_type.csv', title_kept)
+    print(f"Sampled title aka title types:  {i:13,}")
+    i = copy_rows(in_dir, out_dir, 'title_genre.csv', title_kept)
+    print(f"Sampled title genres:           {i:13,}")
+
+    print('')
+    print('Copying reference data files')
+    print('')
+
+    copy_ref_files(in_dir, out_dir)
+
+    print('Finished.')
+    print('')
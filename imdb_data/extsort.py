@@ -0,0 +1,139 @@
+#
+# External (disk-spilling) merge sort for the large link tables. Each file is
+# re-written in the order of its table's primary key, so that the database
+# bulk loads insert in index order, and downstream tools can merge-join on
+# the sorted columns.
+#
+# Memory use is bounded: the input is read in chunks of at most "max_lines"
+# rows, and each chunk is sorted and written out as a "run" file. Runs are
+# sorted in parallel by a pool of worker processes, with no more than
+# "workers" chunks in flight at any one time - so up to (workers + 1) *
+# max_lines rows are held in memory: the chunks in flight, plus the one being
+# read. The runs are then merged, no more than "max_fan_in" at a time, into
+# the final file.
+#
+# ID columns are compared as strings (which is how the databases order the
+# varchar keys) and the other key columns are compared as integers.
+#
+
+import heapq
+import io
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# -----------------------------------------------------
+# Defaults - rows per run file, number of worker
+# processes sorting the runs, and max. number of files
+# merged in one pass.
+#
+max_lines = 1000000
+workers = os.cpu_count() or 1
+max_fan_in = 64
+# -----------------------------------------------------
+
+# For each file: the key columns, as (field index, is numeric) pairs.
+sort_keys = {
+    'talent_title.csv': [(0, False), (1, False)],           # talent_id, title_id
+    'talent_role.csv': [(0, False), (1, True)],             # talent_id, role_id
+    'title_principal.csv': [(0, False), (1, False), (2, True)],  # title_id, talent_id, order
+}
+
+# --------------------------------------------------------------------------
+
+# The key columns all come before any free-text (possibly quoted) columns, so
+# a simple split is safe here.
+def row_key(line, key_spec):
+    fields = line.split(',', len(key_spec))
+    return tuple(int(fields[i]) if numeric else fields[i].rstrip('\r\n')
+            for i, numeric in key_spec)
+
+# --------------------------------------------------------------------------
+
+# Runs in a worker process:
+def write_run(lines, key_spec, run_file):
+    lines.sort(key=partial(row_key, key_spec=key_spec))
+    with io.open(run_file, mode='w', encoding='utf-8', newline='') as out_f:
+        out_f.writelines(lines)
+    return run_file
+
+# --------------------------------------------------------------------------
+
+def merge_runs(run_files, key_spec, out_f):
+    in_fs = [io.open(run_file, mode='r', encoding='utf-8', newline='') for run_file in run_files]
+    try:
+        out_f.writelines(heapq.merge(*in_fs, key=partial(row_key, key_spec=key_spec)))
+    finally:
+        for in_f in in_fs:
+            in_f.close()
+
+# --------------------------------------------------------------------------
+
+# Splits the file (after its header) into sorted run files in tmp_dir, and
+# returns the header and the run file names.
+def generate_runs(fname, key_spec, tmp_dir, max_lines, workers):
+    run_files = []
+    with io.open(fname, mode='r', encoding='utf-8', newline='') as in_f, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        header = next(in_f, '')
+        pending = []
+        chunk = []
+        for line in in_f:
+            chunk.append(line)
+            if len(chunk) >= max_lines:
+                if len(pending) >= workers:
+                    run_files.append(pending.pop(0).result())
+                run_file = os.path.join(tmp_dir, 'run_%06d.csv' % (len(run_files) + len(pending)))
+                pending.append(pool.submit(write_run, chunk, key_spec, run_file))
+                chunk = []
+        if chunk:
+            run_file = os.path.join(tmp_dir, 'run_%06d.csv' % (len(run_files) + len(pending)))
+            pending.append(pool.submit(write_run, chunk, key_spec, run_file))
+        run_files.extend(future.result() for future in pending)
+    return header, run_files
+
+# --------------------------------------------------------------------------
+
+def sort_file(fname, key_spec, tmp_dir=None, max_lines=max_lines,
+        workers=workers, max_fan_in=max_fan_in):
+    print("Sorting " + fname + ".")
+    work_dir = tempfile.mkdtemp(prefix='extsort_', dir=tmp_dir or os.path.dirname(fname))
+    try:
+        header, run_files = generate_runs(fname, key_spec, work_dir, max_lines, workers)
+        print(f" - sorted runs: {len(run_files):13,}")
+
+        # intermediate passes, until the rest can be merged in one go:
+        merge_pass = 0
+        while len(run_files) > max_fan_in:
+            merge_pass += 1
+            merged_files = []
+            for n in range(0, len(run_files), max_fan_in):
+                merged_file = os.path.join(work_dir, 'merge_%d_%06d.csv' % (merge_pass, n))
+                with io.open(merged_file, mode='w', encoding='utf-8', newline='') as out_f:
+                    merge_runs(run_files[n:n + max_fan_in], key_spec, out_f)
+                for run_file in run_files[n:n + max_fan_in]:
+                    os.remove(run_file)
+                merged_files.append(merged_file)
+            run_files = merged_files
+
+        # written alongside the original, in case tmp_dir is on another device:
+        sorted_file = fname + '.sorted'
+        with io.open(sorted_file, mode='w', encoding='utf-8', newline='') as out_f:
+            out_f.write(header)
+            merge_runs(run_files, key_spec, out_f)
+        os.replace(sorted_file, fname)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    print(' - sorted file.')
+
+# --------------------------------------------------------------------------
+
+# Sorts the link files in out_dir in place.
+def sort_link_files(out_dir='csv', file_names=None, tmp_dir=None,
+        max_lines=max_lines, workers=workers, max_fan_in=max_fan_in):
+    file_names = list(sort_keys) if file_names is None else file_names
+    for file_name in file_names:
+        sort_file(os.path.join(out_dir, file_name), sort_keys[file_name], tmp_dir,
+                max_lines, workers, max_fan_in)
@@ -0,0 +1,16 @@
+#
+# Title and talent IDs. An ID is a 2-letter prefix ("tt" for titles, "nm" for
+# talent) followed by digits, and is held as the number the digits make -
+# "tt0063562" is 63562.
+#
+
+def id_num(id_string):
+    return int(id_string[2:])
+
+# As id_num, but a ValueError is raised unless the ID is the given prefix
+# ("tt" or "nm") followed by digits.
+def checked_id_num(id_string, prefix):
+    digits = id_string[2:]
+    if not (id_string.startswith(prefix) and digits.isascii() and digits.isdigit()):
+        raise ValueError('Not a valid ' + prefix + ' ID: ' + repr(id_string))
+    return int(digits)
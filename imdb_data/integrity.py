@@ -0,0 +1,146 @@
+#
+# Orphan ID detection for the normalized csv files. Several of the link files
+# refer to titles and talent which do not exist in title.csv or talent.csv
+# (which is why some FKs are not created in the database scripts).
+#
+# The title and talent IDs are held as bitmaps, keyed by the numeric part of
+# the ID ("tt0063562" is bit 63562) - a few MB even for the full data set.
+# Each link file is then checked against them, and orphan rows are either:
+#
+#  - "report": counted only,
+#  - "drop": removed from the file, or
+#  - "quarantine": moved from the file to <name>_orphan.csv in a separate
+#    directory (by default "orphans" under the csv directory).
+#
+# Null IDs (\N) are not orphans.
+#
+
+import io
+import os
+
+from .ids import checked_id_num
+
+actions = ['report', 'drop', 'quarantine']
+
+# For each link file: the ID columns, as (field index, referenced file) pairs.
+link_refs = {
+    'talent_role.csv': [(0, 'talent.csv')],
+    'talent_title.csv': [(0, 'talent.csv'), (1, 'title.csv')],
+    'title_aka.csv': [(0, 'title.csv')],
+    'title_aka_title_type.csv': [(0, 'title.csv')],
+    'title_episode.csv': [(0, 'title.csv'), (1, 'title.csv')],
+    'title_genre.csv': [(0, 'title.csv')],
+    'title_principal.csv': [(0, 'title.csv'), (1, 'talent.csv')],
+}
+
+# The ID prefix of each referenced file - an ID with the wrong prefix (or not
+# followed by digits) is an orphan.
+ref_prefixes = {'title.csv': 'tt', 'talent.csv': 'nm'}
+
+# --------------------------------------------------------------------------
+
+# Returns the bitmap, and the number of rows skipped because their ID is not
+# well-formed (so any link to them is an orphan).
+def build_bitmap(fname, prefix):
+    bitmap = bytearray()
+    bad = 0
+    with io.open(fname, mode='r', encoding='utf-8') as in_f:
+        next(in_f)
+        for line in in_f:
+            try:
+                num = checked_id_num(line.split(',', 1)[0], prefix)
+            except ValueError:
+                bad += 1
+                continue
+            if (num >> 3) >= len(bitmap):
+                bitmap.extend(bytes((num >> 3) + 1 - len(bitmap)))
+            bitmap[num >> 3] |= 1 << (num & 7)
+    return bitmap, bad
+
+def in_bitmap(bitmap, id_string, prefix):
+    if id_string == '\\N':
+        return True
+    try:
+        num = checked_id_num(id_string, prefix)
+    except ValueError:
+        return False
+    return (num >> 3) < len(bitmap) and bool(bitmap[num >> 3] & (1 << (num & 7)))
+
+# --------------------------------------------------------------------------
+
+# Returns the number of rows checked and the number of orphan rows. If the
+# check fails part way through, the file is left as it was, and the partly
+# written checked and orphan files are removed.
+def check_file(fname, refs, bitmaps, action, orphan_fname=None):
+    i = 0
+    orphans = 0
+    out_f = None
+    orphan_f = None
+    try:
+        with io.open(fname, mode='r', encoding='utf-8', newline='') as in_f:
+            header = next(in_f)
+            if action != 'report':
+                out_f = io.open(fname + '.checked', mode='w', encoding='utf-8', newline='')
+                out_f.write(header)
+            if action == 'quarantine':
+                orphan_f = io.open(orphan_fname, mode='w', encoding='utf-8', newline='')
+                orphan_f.write(header)
+
+            split_count = max(index for index, ref in refs) + 1
+            for line in in_f:
+                i += 1
+                fields = line.split(',', split_count)
+                if all(in_bitmap(bitmaps[ref], fields[index].rstrip('\r\n'), ref_prefixes[ref])
+                        for index, ref in refs):
+                    if out_f:
+                        out_f.write(line)
+                else:
+                    orphans += 1
+                    if orphan_f:
+                        orphan_f.write(line)
+    except BaseException:
+        for f, name in [(out_f, fname + '.checked'), (orphan_f, orphan_fname)]:
+            if f:
+                f.close()
+                os.remove(name)
+        raise
+
+    if out_f:
+        out_f.close()
+        os.replace(fname + '.checked', fname)
+    if orphan_f:
+        orphan_f.close()
+    return i, orphans
+
+# --------------------------------------------------------------------------
+
+def check_integrity(out_dir='csv', action='report', orphan_dir=None):
+    if action not in actions:
+        raise ValueError('Unknown action: ' + action)
+    orphan_dir = os.path.join(out_dir, 'orphans') if orphan_dir is None else orphan_dir
+    if action == 'quarantine':
+        os.makedirs(orphan_dir, exist_ok=True)
+
+    print("Checking for orphan IDs in " + out_dir + ".")
+    bitmaps = {}
+    for ref, prefix in ref_prefixes.items():
+        bitmaps[ref], bad = build_bitmap(os.path.join(out_dir, ref), prefix)
+        if bad:
+            print(f" - {ref:28} skipped rows with bad IDs: {bad:13,}")
+
+    results = {}
+    for file_name, refs in link_refs.items():
+        fname = os.path.join(out_dir, file_name)
+        if not os.path.exists(fname):
+            print(f" - {file_name:28} not found, skipped.")
+            continue
+        orphan_fname = os.path.join(orphan_dir, file_name.replace('.csv', '_orphan.csv'))
+        i, orphans = check_file(fname, refs, bitmaps, action, orphan_fname)
+        results[file_name] = orphans
+        print(f" - {file_name:28} rows: {i:13,}   orphans: {orphans:13,}")
+
+    if action == 'drop':
+        print(' - orphan rows dropped.')
+    elif action == 'quarantine':
+        print(' - orphan rows moved to ' + orphan_dir + '.')
+    return results
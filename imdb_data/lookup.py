@@ -0,0 +1,266 @@
+#
+# Read-only lookups over the normalized csv files, without a database.
+#
+# "build_indexes" writes one binary index file per entry in "indexes" below,
+# to an index directory (by default "index" under the csv directory). An index
+# file is a short header followed by fixed-size records, sorted by key:
+#
+#   header: magic (8 bytes), record count, size and modification time (in ns)
+#           of the csv file (8 bytes each)
+#   record: key (4 bytes), sub-key (4 bytes), offset of the csv row (8 bytes)
+#
+# All numbers are big-endian, so records sort the same way as their bytes.
+# The key is the numeric part of a title or talent ID ("tt0063562" is 63562).
+# The sub-key orders the rows for one key - e.g. the principals of a title,
+# by their order.
+#
+# An index is refused if its csv file has since changed size or modification
+# time - e.g. after being re-written by the "sort" command.
+#
+# "Lookup" memory-maps the index and csv files, and answers point and range
+# lookups by binary search over the records - so opening it does not read
+# the files, and it starts up in well under a second.
+#
+
+import csv
+import heapq
+import io
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from functools import partial
+
+from .ids import checked_id_num
+
+magic = b'IMDBIDX\x02'
+header = struct.Struct('>8sQQQ')
+record = struct.Struct('>IIQ')
+key_struct = struct.Struct('>I')
+
+# max. records held in memory while sorting an index:
+max_records = 2000000
+
+# --------------------------------------------------------------------------
+
+def int_or_zero(value):
+    return int(value) if value.isdigit() else 0
+
+def episode_sub_key(fields):
+    return (min(int_or_zero(fields[2]), 0xFFFF) << 16) | min(int_or_zero(fields[3]), 0xFFFF)
+
+# For each index: the csv file, the key column, the key's ID prefix, and a
+# function giving the sub-key from the split fields.
+indexes = {
+    'title': ('title.csv', 0, 'tt', lambda fields: 0),
+    'talent': ('talent.csv', 0, 'nm', lambda fields: 0),
+    'title_principal': ('title_principal.csv', 0, 'tt', lambda fields: int_or_zero(fields[2])),
+    'talent_principal': ('title_principal.csv', 1, 'nm', lambda fields: checked_id_num(fields[0], 'tt')),
+    'series_episode': ('title_episode.csv', 1, 'tt', episode_sub_key),
+}
+
+def index_file_name(index_dir, name):
+    return os.path.join(index_dir, name + '.idx')
+
+# --------------------------------------------------------------------------
+
+# Yields a packed record for each row of the csv file with a valid key. The
+# key and sub-key columns all come before any free-text (possibly quoted)
+# columns, so a simple split is safe here.
+def index_records(fname, key_col, prefix, sub_key):
+    with io.open(fname, mode='rb') as in_f:
+        offset = len(next(in_f))
+        for line in in_f:
+            fields = line.decode('utf-8').rstrip('\r\n').split(',', 4)
+            try:
+                yield record.pack(checked_id_num(fields[key_col], prefix), sub_key(fields), offset)
+            except (ValueError, IndexError):
+                pass # null or malformed key
+            offset += len(line)
+
+# --------------------------------------------------------------------------
+
+def write_sorted_records(records, out_f, tmp_dir, max_records=max_records):
+    run_files = []
+    work_dir = tempfile.mkdtemp(prefix='index_', dir=tmp_dir)
+    try:
+        chunk = []
+        for rec in records:
+            chunk.append(rec)
+            if len(chunk) >= max_records:
+                run_files.append(write_run(chunk, work_dir, len(run_files)))
+                chunk = []
+        chunk.sort()
+        if not run_files:
+            out_f.writelines(chunk)
+            return len(chunk)
+
+        run_files.append(write_run(chunk, work_dir, len(run_files)))
+        in_fs = [io.open(run_file, mode='rb') for run_file in run_files]
+        try:
+            count = 0
+            for rec in heapq.merge(*[iter(partial(in_f.read, record.size), b'') for in_f in in_fs]):
+                out_f.write(rec)
+                count += 1
+            return count
+        finally:
+            for in_f in in_fs:
+                in_f.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def write_run(chunk, work_dir, n):
+    chunk.sort()
+    run_file = os.path.join(work_dir, 'run_%06d.idx' % n)
+    with io.open(run_file, mode='wb') as out_f:
+        out_f.writelines(chunk)
+    return run_file
+
+# --------------------------------------------------------------------------
+
+def build_index(csv_dir, index_dir, name):
+    file_name, key_col, prefix, sub_key = indexes[name]
+    fname = os.path.join(csv_dir, file_name)
+    out_fname = index_file_name(index_dir, name)
+    csv_stat = os.stat(fname)
+    with io.open(out_fname + '.tmp', mode='wb') as out_f:
+        out_f.write(header.pack(magic, 0, 0, 0))
+        count = write_sorted_records(index_records(fname, key_col, prefix, sub_key), out_f, index_dir)
+        out_f.seek(0)
+        out_f.write(header.pack(magic, count, csv_stat.st_size, csv_stat.st_mtime_ns))
+    if os.stat(fname).st_mtime_ns != csv_stat.st_mtime_ns:
+        os.remove(out_fname + '.tmp')
+        raise ValueError('csv file changed while being indexed: ' + fname)
+    os.replace(out_fname + '.tmp', out_fname)
+    return count
+
+def build_indexes(csv_dir='csv', index_dir=None, names=None):
+    index_dir = os.path.join(csv_dir, 'index') if index_dir is None else index_dir
+    names = list(indexes) if names is None else names
+    os.makedirs(index_dir, exist_ok=True)
+    print("Building lookup indexes in " + index_dir + ".")
+    for name in names:
+        count = build_index(csv_dir, index_dir, name)
+        print(f" - {name:28} records: {count:13,}")
+
+# --------------------------------------------------------------------------
+
+def map_file(fname):
+    with io.open(fname, mode='rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class Index:
+
+    def __init__(self, index_fname, csv_fname):
+        self.mm = map_file(index_fname)
+        self.csv_mm = b''
+        try:
+            file_magic, self.count, csv_size, csv_mtime_ns = header.unpack_from(self.mm, 0)
+            if file_magic != magic:
+                raise ValueError('Not a lookup index (or built by an older version): ' + index_fname)
+            csv_stat = os.stat(csv_fname)
+            if csv_size != csv_stat.st_size or csv_mtime_ns != csv_stat.st_mtime_ns:
+                raise ValueError('Lookup index is out of date: ' + index_fname)
+            self.csv_mm = map_file(csv_fname)
+        except Exception:
+            self.close()
+            raise
+        end = self.csv_mm.find(b'\n')
+        self.fields = next(csv.reader([self.csv_mm[:end].decode('utf-8').rstrip('\r')]))
+
+    # the position of the first record whose key is not less than "key":
+    def lower_bound(self, key):
+        prefix = key_struct.pack(key)
+        mm = self.mm
+        lo = 0
+        hi = self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos = header.size + mid * record.size
+            if mm[pos:pos + 4] < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def read_row(self, offset):
+        end = self.csv_mm.find(b'\n', offset)
+        line = self.csv_mm[offset:end if end >= 0 else len(self.csv_mm)].decode('utf-8').rstrip('\r')
+        return dict(zip(self.fields, next(csv.reader([line]))))
+
+    # rows with keys from "lo" to "hi" inclusive, up to "limit" of them:
+    def range(self, lo, hi, limit=None):
+        rows = []
+        if lo > hi or lo > 0xFFFFFFFF or hi < 0:
+            return rows
+        n = self.lower_bound(max(lo, 0))
+        while n < self.count and (limit is None or len(rows) < limit):
+            key, sub_key, offset = record.unpack_from(self.mm, header.size + n * record.size)
+            if key > hi:
+                break
+            rows.append(self.read_row(offset))
+            n += 1
+        return rows
+
+    def get(self, key):
+        return self.range(key, key)
+
+    def close(self):
+        for mm in [self.mm, self.csv_mm]:
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+
+# --------------------------------------------------------------------------
+
+# IDs are passed and returned as strings ("tt0063562"). A ValueError is raised
+# for an ID which is not well-formed.
+class Lookup:
+
+    def __init__(self, csv_dir='csv', index_dir=None):
+        index_dir = os.path.join(csv_dir, 'index') if index_dir is None else index_dir
+        self.indexes = {}
+        try:
+            for name, (file_name, key_col, prefix, sub_key) in indexes.items():
+                self.indexes[name] = Index(index_file_name(index_dir, name),
+                        os.path.join(csv_dir, file_name))
+        except Exception:
+            self.close()
+            raise
+
+    def get(self, name, id_string):
+        return self.indexes[name].get(checked_id_num(id_string, indexes[name][2]))
+
+    def range(self, name, from_id, to_id, limit=None):
+        prefix = indexes[name][2]
+        return self.indexes[name].range(checked_id_num(from_id, prefix),
+                checked_id_num(to_id, prefix), limit)
+
+    def title(self, title_id):
+        rows = self.get('title', title_id)
+        return rows[0] if rows else None
+
+    def talent(self, talent_id):
+        rows = self.get('talent', talent_id)
+        return rows[0] if rows else None
+
+    def principals(self, title_id):
+        return self.get('title_principal', title_id)
+
+    def filmography(self, talent_id):
+        return self.get('talent_principal', talent_id)
+
+    def episodes(self, series_id):
+        return self.get('series_episode', series_id)
+
+    def title_range(self, from_title_id, to_title_id, limit=None):
+        return self.range('title', from_title_id, to_title_id, limit)
+
+    def talent_range(self, from_talent_id, to_talent_id, limit=None):
+        return self.range('talent', from_talent_id, to_talent_id, limit)
+
+    def close(self):
+        for index in self.indexes.values():
+            index.close()
@@ -0,0 +1,327 @@
+#
+# Takes the normalized csv files created by the "process" module and
+# writes a sample of them to a separate directory - by default
+# "csv/sampled". The sample is driven by a selection of title IDs.
+#
+
+import hashlib
+import io
+import os
+from shutil import copyfile
+
+# -----------------------------------------------------
+# -----------------------------------------------------
+# This is the default approx. number of title records to grab:
+#
+#
+sample_size = 2000
+#
+#
+# Other data will be sampled based on these title IDs.
+# The sample size is approximate because nobody likes
+# nice round numbers. Also, bear in mind that an episode
+# belongs to a series - which means 2 title records are
+# needed. Otherwise you will have episode names (not
+# often very useful), but no series name.
+#
+# Therefore...
+#
+#
+series_thresh=100
+#
+#
+# ...the above threshold is used to ensure you have at
+# least some series titles for sampled episode titles.
+# -----------------------------------------------------
+# -----------------------------------------------------
+
+
+def line_count(fname):
+    i = 0
+    with io.open(fname, mode='r', encoding='utf-8') as f:
+        for i, l in enumerate(f):
+            pass
+    return i
+
+# --------------------------------------------------------------------------
+
+# Several samples can be taken in one pass over the files. Each title is given
+# a "level" - the number of samples it belongs to, counting from the largest
+# sample. A level of 0 means the title is not sampled.
+#
+# For nested samples, each title gets a rank from 0 up to the number of titles,
+# from a hash of its ID - so the ranks are spread evenly, and are the same from
+# one run to the next. A title is in every sample whose size is greater than its
+# rank, so each smaller sample is a subset of the larger ones, and each sample
+# is very close to the size asked for.
+
+def title_rank(title_id, title_records):
+    digest = hashlib.blake2b(title_id.encode('utf-8'), digest_size=8).digest()
+    return (int.from_bytes(digest, 'big') * title_records) >> 64
+
+def rank_level(title_id, title_records, sample_sizes):
+    rank = title_rank(title_id, title_records)
+    return sum(1 for size in sample_sizes if rank < size)
+
+def open_outputs(out_dirs, file_name, header, mode='w'):
+    outs = [io.open(os.path.join(out_dir, file_name), mode=mode, encoding='utf-8') for out_dir in out_dirs]
+    if header:
+        for out_f in outs:
+            out_f.write(header)
+    return outs
+
+def close_outputs(outs):
+    for out_f in outs:
+        out_f.close()
+
+def print_counts(label, counts):
+    print(f"{label:32}" + ''.join(f"{count:13,}" for count in counts))
+
+# --------------------------------------------------------------------------
+
+# Copies the rows of a file whose first field (a title or talent ID) has a
+# level, to that many of the output files. Returns the row count per sample.
+def copy_by_level(in_dir, out_dirs, file_name, levels):
+    counts = [0] * len(out_dirs)
+    with io.open(os.path.join(in_dir, file_name), mode='r', encoding='utf-8') as in_f:
+        outs = open_outputs(out_dirs, file_name, next(in_f))
+        for line in in_f:
+            level = levels.get(line.split(',', 1)[0], 0)
+            for k in range(level):
+                counts[k] += 1
+                outs[k].write(line)
+        close_outputs(outs)
+    return counts
+
+# --------------------------------------------------------------------------
+
+# One sample, of every n-th title.
+def sample_titles(in_dir='csv', out_dir=os.path.join('csv', 'sampled'),
+        sample_size=sample_size, series_thresh=series_thresh):
+    write_samples(in_dir, [out_dir], [sample_size], series_thresh, ranked=False)
+
+# Writes one nested sample per size, to a sub-directory of out_dir named
+# after the size (for example "csv/sampled/1000").
+def sample_sizes(in_dir='csv', out_dir=os.path.join('csv', 'sampled'),
+        sizes=None, series_thresh=series_thresh):
+    sizes = sorted(set(sizes or (sample_size,)), reverse=True)
+    out_dirs = [os.path.join(out_dir, str(size)) for size in sizes]
+    write_samples(in_dir, out_dirs, sizes, series_thresh, ranked=True)
+
+# --------------------------------------------------------------------------
+
+# The sample sizes must be in descending order, with one output directory each.
+# Titles are sampled by rank if "ranked" is set, otherwise by taking every n-th
+# title (for a single sample only).
+def write_samples(in_dir, out_dirs, sample_sizes, series_thresh=series_thresh, ranked=True):
+    if any(size < 1 for size in sample_sizes):
+        raise ValueError('Sample sizes must be at least 1')
+    if not ranked and len(sample_sizes) != 1:
+        raise ValueError('Only one sample can be taken without ranking')
+
+    for out_dir in out_dirs:
+        os.makedirs(out_dir, exist_ok=True)
+
+    print('')
+    print('Starting...')
+
+    title_records = line_count(os.path.join(in_dir, 'title.csv'))
+
+    print('')
+    print(f"Total source titles:            {title_records:13,}")
+    print('')
+
+    sample_freq = max(round(title_records / sample_sizes[0]), 1)
+    if len(sample_sizes) > 1:
+        print_counts('Sample sizes:', sample_sizes)
+
+    # --------------------------------------------------------------------------
+    # titles
+
+    title_levels = {}
+    episodes = {} # will be used later to get some series records
+    counts = [0] * len(out_dirs)
+    i = 1
+    with io.open(os.path.join(in_dir, 'title.csv'), mode='r', encoding='utf-8') as in_f:
+        outs = open_outputs(out_dirs, 'title.csv', next(in_f))
+        for line in in_f:
+            i += 1
+            if ranked:
+                level = rank_level(line.split(',', 1)[0], title_records, sample_sizes)
+            else:
+                level = 1 if i % sample_freq == 0 else 0
+            if level:
+                fields = line.split(',')
+                title_levels[fields[0]] = level
+                if fields[1] == '5': # content type for TV episodes
+                    episodes[fields[0]] = level
+                for k in range(level):
+                    counts[k] += 1
+                    outs[k].write(line)
+        close_outputs(outs)
+
+    print_counts('Sampled titles:', counts)
+
+    # --------------------------------------------------------------------------
+    # talent titles
+
+    # For talent names, we look in 2 places:
+    #   1) the talent titles CSV file (here)
+    #   2) the title principals CSV file (next)
+    # A talent's level is the highest level of its titles.
+
+    talent_levels = {}
+
+    counts = [0] * len(out_dirs)
+    with io.open(os.path.join(in_dir, 'talent_title.csv'), mode='r', encoding='utf-8') as in_f:
+        outs = open_outputs(out_dirs, 'talent_title.csv', next(in_f))
+        for line in in_f:
+            fields = line.split(',')
+            talent_id = fields[0]
+            title_id = fields[1].strip()
+            level = title_levels.get(title_id, 0)
+            if level:
+                if level > talent_levels.get(talent_id, 0):
+                    talent_levels[talent_id] = level
+                for k in range(level):
+                    counts[k] += 1
+                    outs[k].write(line)
+        close_outputs(outs)
+
+    print_counts('Sampled talent titles:', counts)
+
+    # --------------------------------------------------------------------------
+    # title principals
+    # SEE ALSO talent titles above.
+
+    counts = [0] * len(out_dirs)
+    with io.open(os.path.join(in_dir, 'title_principal.csv'), mode='r', encoding='utf-8') as in_f:
+        outs = open_outputs(out_dirs, 'title_principal.csv', next(in_f))
+        for line in in_f:
+            fields = line.split(',')
+            title_id = fields[0]
+            talent_id = fields[1].strip()
+            level = title_levels.get(title_id, 0)
+            if level:
+                if level > talent_levels.get(talent_id, 0):
+                    talent_levels[talent_id] = level
+                for k in range(level):
+                    counts[k] += 1
+                    outs[k].write(line)
+        close_outputs(outs)
+
+    print_counts('Sampled title principals:', counts)
+
+    # --------------------------------------------------------------------------
+    # talent
+
+    copy_by_level(in_dir, out_dirs, 'talent.csv', talent_levels)
+
+    print_counts('Sampled talent:', [sum(1 for level in talent_levels.values() if level > k)
+            for k in range(len(out_dirs))])
+
+    # --------------------------------------------------------------------------
+    # talent roles, title akas, title aka title types, title genres
+
+    counts = copy_by_level(in_dir, out_dirs, 'talent_role.csv', talent_levels)
+    print_counts('Sampled talent roles:', counts)
+
+    counts = copy_by_level(in_dir, out_dirs, 'title_aka.csv', title_levels)
+    print_counts('Sampled title akas:', counts)
+
+    counts = copy_by_level(in_dir, out_dirs, 'title_aka_title_type.csv', title_levels)
+    print_counts('Sampled title aka title types:', counts)
+
+    counts = copy_by_level(in_dir, out_dirs, 'title_genre.csv', title_levels)
+    print_counts('Sampled title genres:', counts)
+
+    # --------------------------------------------------------------------------
+    # title series - here we may need to capture some more title records,
+    # to account for cases where we have episode records, but not the
+    # parent series records.  But only up to 'series_thresh' limit, per
+    # sample. To keep the samples nested, a series added for a smaller
+    # sample is also added to the larger ones, even past their limit.
+
+    missing_series = [set() for out_dir in out_dirs]
+
+    counts = [0] * len(out_dirs)
+    with io.open(os.path.join(in_dir, 'title_episode.csv'), mode='r', encoding='utf-8') as in_f:
+        outs = open_outputs(out_dirs, 'title_episode.csv', next(in_f))
+        for line in in_f:
+            fields = line.split(',')
+            title_id = fields[0]
+            parent_title_id = fields[1]
+            title_level = title_levels.get(title_id, 0)
+            parent_level = title_levels.get(parent_title_id, 0)
+            episode_level = episodes.get(title_id, 0)
+            added = False
+            for k in reversed(range(title_level)):
+                if k < parent_level:
+                    # we already have the parent (series) for the child (episode):
+                    counts[k] += 1
+                    outs[k].write(line)
+                elif k < episode_level and (added or counts[k] < series_thresh):
+                    # we do not have the parent (series) for this episode:
+                    missing_series[k].add(parent_title_id)
+                    added = True
+                    counts[k] += 1
+                    outs[k].write(line)
+        close_outputs(outs)
+
+    print_counts('Sampled title episodes:', counts)
+
+    # -------------------------------------------------------
+
+    # here we grab the extra series titles we need for the titles files:
+    counts = [0] * len(out_dirs)
+    if any(missing_series):
+        with io.open(os.path.join(in_dir, 'title.csv'), mode='r', encoding='utf-8') as in_f:
+            outs = open_outputs(out_dirs, 'title.csv', None, mode='a')
+            next(in_f)
+            for line in in_f:
+                title_id = line.split(',', 1)[0]
+                for k in range(len(out_dirs)):
+                    if title_id in missing_series[k]:
+                        counts[k] += 1
+                        outs[k].write(line)
+            close_outputs(outs)
+
+    print_counts('Sampled extra series titles:', counts)
+
+    # --------------------------------------------------------------------------
+    # other small ref data files
+
+    print('')
+    print('Copying reference data files')
+    print('')
+
+    for out_dir in out_dirs:
+        copy_ref_files(in_dir, out_dir)
+
+    print('Finished.')
+    print('')
+
+# --------------------------------------------------------------------------
+
+ref_files = ['region', 'role', 'language', 'genre',
+        'category', 'content_type', 'title_type']
+
+# Only created when the text columns are encoded - so each is copied only if
+# its link file refers to it by ID, and not if it was left behind by an
+# earlier run with encoded text:
+optional_ref_files = {
+    'job': ('title_principal.csv', 'job_id'),
+    'additional_attrs': ('title_aka.csv', 'additional_attrs_id'),
+}
+
+def header_fields(fname):
+    with io.open(fname, mode='r', encoding='utf-8') as in_f:
+        return next(in_f, '').rstrip('\r\n').split(',')
+
+def copy_ref_files(in_dir, out_dir):
+    for file in ref_files:
+        copyfile(os.path.join(in_dir, file + '.csv'), os.path.join(out_dir, file + '.csv'))
+    for file, (link_file, id_col) in optional_ref_files.items():
+        link_fname = os.path.join(in_dir, link_file)
+        if os.path.exists(link_fname) and id_col in header_fields(link_fname):
+            copyfile(os.path.join(in_dir, file + '.csv'), os.path.join(out_dir, file + '.csv'))
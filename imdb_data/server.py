@@ -0,0 +1,92 @@
+#
+# A small local, read-only HTTP server over the lookup indexes. Responses are
+# JSON; a missing title or talent gives a 404, and a malformed ID or limit
+# a 400.
+#
+#   GET /title/<title_id>                   the title
+#   GET /title/<title_id>/principals        its principals (cast & crew)
+#   GET /title/<title_id>/episodes          its episodes, if it is a series
+#   GET /talent/<talent_id>                 the talent
+#   GET /talent/<talent_id>/titles          its title principal rows
+#   GET /titles?from=<id>&to=<id>&limit=n   a range of titles
+#   GET /talent?from=<id>&to=<id>&limit=n   a range of talent
+#
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .lookup import Lookup
+
+host = '127.0.0.1'
+port = 8080
+
+# default and max. number of rows for a range lookup:
+range_limit = 100
+max_range_limit = 10000
+
+# --------------------------------------------------------------------------
+
+def route(lookup, path, query):
+    parts = [part for part in path.split('/') if part]
+    if len(parts) == 1 and parts[0] in ['titles', 'talent']:
+        limit = int(query.get('limit', [range_limit])[0])
+        if limit < 1:
+            raise ValueError('limit must be at least 1')
+        limit = min(limit, max_range_limit)
+        find_range = lookup.title_range if parts[0] == 'titles' else lookup.talent_range
+        return find_range(query['from'][0], query['to'][0], limit)
+    if len(parts) == 2 and parts[0] == 'title':
+        return lookup.title(parts[1])
+    if len(parts) == 2 and parts[0] == 'talent':
+        return lookup.talent(parts[1])
+    if len(parts) == 3 and parts[0] == 'title' and parts[2] == 'principals':
+        return lookup.principals(parts[1])
+    if len(parts) == 3 and parts[0] == 'title' and parts[2] == 'episodes':
+        return lookup.episodes(parts[1])
+    if len(parts) == 3 and parts[0] == 'talent' and parts[2] == 'titles':
+        return lookup.filmography(parts[1])
+    raise LookupError(path)
+
+# --------------------------------------------------------------------------
+
+def make_handler(lookup):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            try:
+                result = route(lookup, url.path, parse_qs(url.query))
+                status = 200 if result is not None else 404
+            except LookupError:
+                status, result = 404, None
+            except (ValueError, KeyError):
+                status, result = 400, None
+            if result is None:
+                result = {'error': self.responses[status][0]}
+            body = json.dumps(result).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+# --------------------------------------------------------------------------
+
+def serve(csv_dir='csv', index_dir=None, host=host, port=port):
+    lookup = Lookup(csv_dir, index_dir)
+    server = ThreadingHTTPServer((host, port), make_handler(lookup))
+    print(f"Serving lookups on http://{host}:{server.server_port}/ - press Ctrl-C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        lookup.close()
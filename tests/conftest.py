@@ -0,0 +1,24 @@
+import csv
+import io
+import os
+import sys
+
+import pytest
+
+# so the tests can import the imdb_data package without it being installed:
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Writes a csv file the way the "process" module writes them - csv.writer, with
+# \r\n line endings. The header and each row are lists of fields; a row can
+# also be given as a string, which is split on commas. Returns the file name.
+def write_csv_file(out_dir, file_name, header, rows):
+    fname = os.path.join(out_dir, file_name)
+    with io.open(fname, mode='w', encoding='utf-8', newline='') as out_f:
+        writer = csv.writer(out_f)
+        writer.writerow(header.split(',') if isinstance(header, str) else header)
+        writer.writerows(row.split(',') if isinstance(row, str) else row for row in rows)
+    return fname
+
+@pytest.fixture
+def write_csv():
+    return write_csv_file
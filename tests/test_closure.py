@@ -0,0 +1,139 @@
+import io
+import os
+
+import pytest
+
+from imdb_data.cli import main
+from imdb_data.closure import build_csr, build_graph, closure, neighbours, read_keys, sample_closure
+from imdb_data.sample import ref_files
+
+# A small graph - tt0000003 is a series, with episodes tt0000004 and tt0000005.
+# The principals link tt1 - nm1 - tt2 - nm2 - tt6, and the episode tt5 to nm3.
+# Titles and talent are node 0 for tt1/nm1, node 1 for tt2/nm2, and so on.
+files = {
+    'title.csv': ('title_id,content_type_id,primary_title', [
+        'tt0000001,2,Movie One',
+        'tt0000002,2,Movie Two',
+        'tt0000003,3,Series',
+        'tt0000004,5,Episode 1',
+        'tt0000005,5,Episode 2',
+        'tt0000006,2,Movie Three',
+    ]),
+    'talent.csv': ('talent_id,talent_name', ['nm0000001,One', 'nm0000002,Two', 'nm0000003,Three']),
+    'title_principal.csv': ('title_id,talent_id,order,category_id,job,role_names', [
+        'tt0000001,nm0000001,1,1,\\N,\\N',
+        'tt0000002,nm0000001,1,1,\\N,\\N',
+        'tt0000002,nm0000002,2,1,\\N,\\N',
+        'tt0000006,nm0000002,1,1,\\N,\\N',
+        'tt0000009,nm0000001,1,1,\\N,\\N', # no such title
+    ]),
+    'talent_title.csv': ('talent_id,title_id', ['nm0000003,tt0000005']),
+    'title_episode.csv': ('title_id,parent_title_id,season_number,episode_number', [
+        'tt0000004,tt0000003,1,1',
+        'tt0000005,tt0000003,1,2',
+    ]),
+    'talent_role.csv': ('talent_id,role_id,order', ['nm0000002,1,1', 'nm0000003,1,1']),
+    'title_aka.csv': ('title_id,order,title', ['tt0000001,1,Eins', 'tt0000006,1,Drei']),
+    'title_aka_title_type.csv': ('title_id,order,title_type_id', ['tt0000006,1,1']),
+    'title_genre.csv': ('title_id,genre_id', ['tt0000002,1', 'tt0000004,1']),
+}
+
+@pytest.fixture
+def csv_dir(tmp_path, write_csv):
+    for file_name, (header, rows) in files.items():
+        write_csv(tmp_path, file_name, header, rows)
+    for file in ref_files:
+        write_csv(tmp_path, file + '.csv', file + '_id,' + file + '_name', ['1,one'])
+    return str(tmp_path)
+
+@pytest.fixture
+def graph(csv_dir):
+    return build_graph(csv_dir)
+
+def sampled(graph, seeds, depth, max_rows=None):
+    title_seen, talent_seen = closure(graph, seeds, depth, max_rows)
+    return ([n + 1 for n in range(len(title_seen)) if title_seen[n]],
+            [n + 1 for n in range(len(talent_seen)) if talent_seen[n]])
+
+def read_ids(fname, count=1):
+    with io.open(fname, mode='r', encoding='utf-8') as in_f:
+        next(in_f)
+        return {tuple(line.rstrip('\n').split(',')[:count]) for line in in_f}
+
+# --------------------------------------------------------------------------
+
+def test_read_keys_in_order(tmp_path, write_csv):
+    fname = write_csv(tmp_path, 'title.csv', 'title_id,primary_title',
+            [[title_id, 'A Title'] for title_id in ['tt0000001', 'tt0000005', 'tt0000012']])
+    assert list(read_keys(fname)) == [1, 5, 12]
+
+def test_read_keys_out_of_order(tmp_path, write_csv):
+    fname = write_csv(tmp_path, 'title.csv', 'title_id,primary_title',
+            [[title_id, 'A Title'] for title_id in ['tt0000012', 'tt0000001', 'tt0000005']])
+    assert list(read_keys(fname)) == [1, 5, 12]
+
+def test_build_csr():
+    csr = build_csr([2, 0, 2], [5, 6, 7], 4)
+    assert [list(neighbours(csr, n)) for n in range(4)] == [[6], [], [5, 7], []]
+
+def test_build_graph(graph):
+    assert list(graph.title_keys) == [1, 2, 3, 4, 5, 6]
+    assert [sorted(neighbours(graph.title_talent, n)) for n in range(6)] == \
+            [[0], [0, 1], [], [], [2], [1]]
+    assert [sorted(neighbours(graph.talent_title, n)) for n in range(3)] == [[0, 1], [1, 5], [4]]
+    assert sorted(neighbours(graph.series_episodes, 2)) == [3, 4]
+    assert list(graph.episode_series) == [-1, -1, -1, 2, 2, -1]
+
+# --------------------------------------------------------------------------
+
+@pytest.mark.parametrize('depth, titles, talent', [
+    (0, [1], []),
+    (1, [1], [1]),
+    (2, [1, 2], [1]),
+    (3, [1, 2], [1, 2]),
+    (4, [1, 2, 6], [1, 2]),
+])
+def test_nodes_reached_at_each_depth(graph, depth, titles, talent):
+    assert sampled(graph, [0], depth) == (titles, talent)
+
+def test_stops_at_the_row_budget(graph):
+    assert sampled(graph, [0], 4, max_rows=3) == ([1, 2], [1])
+    assert sampled(graph, [0], 4, max_rows=1) == ([1], [])
+
+def test_seed_episode_brings_its_series_and_other_episodes(graph):
+    # the series comes along with the seed, even past the budget:
+    assert sampled(graph, [3], 0, max_rows=1) == ([3, 4], [])
+    assert sampled(graph, [3], 0) == ([3, 4], [])
+    assert sampled(graph, [3], 1) == ([3, 4, 5], [])
+    assert sampled(graph, [3], 2) == ([3, 4, 5], [3])
+
+# --------------------------------------------------------------------------
+
+def test_sample_closure_writes_only_links_with_both_ends_sampled(csv_dir):
+    out_dir = os.path.join(csv_dir, 'sampled')
+    # seeds are every 3rd title - the series tt0000003 and the movie tt0000006:
+    sample_closure(csv_dir, out_dir, sample_size=2, depth=1)
+
+    titles = {ids[0] for ids in read_ids(os.path.join(out_dir, 'title.csv'))}
+    talent = {ids[0] for ids in read_ids(os.path.join(out_dir, 'talent.csv'))}
+    assert titles == {'tt0000003', 'tt0000004', 'tt0000005', 'tt0000006'}
+    assert talent == {'nm0000002'}
+
+    principals = read_ids(os.path.join(out_dir, 'title_principal.csv'), 2)
+    assert principals == {('tt0000006', 'nm0000002')}
+    assert read_ids(os.path.join(out_dir, 'talent_title.csv'), 2) == set()
+    episodes = read_ids(os.path.join(out_dir, 'title_episode.csv'), 2)
+    assert episodes == {('tt0000004', 'tt0000003'), ('tt0000005', 'tt0000003')}
+    for title_id, parent_id in episodes:
+        assert title_id in titles and parent_id in titles
+
+    assert read_ids(os.path.join(out_dir, 'talent_role.csv')) == {('nm0000002',)}
+    assert read_ids(os.path.join(out_dir, 'title_genre.csv')) == {('tt0000004',)}
+
+# --------------------------------------------------------------------------
+
+@pytest.mark.parametrize('option', [['--series-thresh', '10'], ['--sample-sizes', '10', '20'],
+        ['--depth', '-1'], ['--max-rows', '0']])
+def test_bad_closure_options_rejected(option):
+    with pytest.raises(SystemExit):
+        main(['sample', '--mode', 'closure'] + option)
@@ -0,0 +1,46 @@
+import io
+import os
+import random
+
+import pytest
+
+from imdb_data.cli import main
+from imdb_data.extsort import row_key, sort_file, sort_keys
+
+row_count = 5000
+
+@pytest.fixture
+def principal_file(tmp_path, write_csv):
+    rng = random.Random(7)
+    rows = [['tt%07d' % rng.randrange(1, 300), 'nm%07d' % rng.randrange(1, 300),
+            str(rng.randrange(1, 12)), '1', '\\N', 'A Role, quoted']
+            for n in range(row_count)]
+    return write_csv(tmp_path, 'title_principal.csv',
+            'title_id,talent_id,order,category_id,job,role_names', rows)
+
+def read_lines(fname):
+    with io.open(fname, mode='r', encoding='utf-8', newline='') as in_f:
+        return list(in_f)
+
+# 136 runs, merged 4 at a time - so several intermediate passes:
+def test_many_runs_and_merge_passes(principal_file):
+    before = read_lines(principal_file)
+    key_spec = sort_keys['title_principal.csv']
+    sort_file(principal_file, key_spec, max_lines=37, workers=3, max_fan_in=4)
+    after = read_lines(principal_file)
+
+    assert after[0] == before[0]
+    assert sorted(after[1:]) == sorted(before[1:])
+    keys = [row_key(line, key_spec) for line in after[1:]]
+    assert keys == sorted(keys)
+    assert os.listdir(os.path.dirname(principal_file)) == ['title_principal.csv']
+
+def test_numeric_key_columns_sort_as_numbers():
+    key_spec = sort_keys['title_principal.csv']
+    lines = ['tt0000001,nm0000001,10,1\r\n', 'tt0000001,nm0000001,9,1\r\n']
+    assert sorted(lines, key=lambda line: row_key(line, key_spec)) == list(reversed(lines))
+
+@pytest.mark.parametrize('option', [['--workers', '0'], ['--max-lines', '0']])
+def test_bad_sort_options_rejected(option):
+    with pytest.raises(SystemExit):
+        main(['sort'] + option)
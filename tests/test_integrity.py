@@ -0,0 +1,51 @@
+import io
+import os
+
+import pytest
+
+from imdb_data import integrity
+from imdb_data.integrity import check_file, check_integrity
+
+def read(fname):
+    with io.open(fname, mode='r', encoding='utf-8', newline='') as in_f:
+        return in_f.read()
+
+@pytest.fixture
+def csv_dir(tmp_path, write_csv):
+    write_csv(tmp_path, 'title.csv', 'title_id,primary_title', ['tt0000001,A', 'tt0000002,B'])
+    write_csv(tmp_path, 'talent.csv', 'talent_id,talent_name', ['nm0000001,C'])
+    write_csv(tmp_path, 'title_principal.csv', 'title_id,talent_id,order', [
+        'tt0000001,nm0000001,1',
+        'tt0000002,nm0000009,1', # no such talent
+        'nm0000001,nm0000001,1', # talent ID in the title column
+        'tt00000x2,nm0000001,1', # malformed
+        'tt0000002,\\N,2',
+    ])
+    return str(tmp_path)
+
+def test_orphans_include_wrong_prefixes(csv_dir):
+    results = check_integrity(csv_dir, 'quarantine')
+    assert results['title_principal.csv'] == 3
+    assert read(os.path.join(csv_dir, 'title_principal.csv')) == \
+            'title_id,talent_id,order\r\ntt0000001,nm0000001,1\r\ntt0000002,\\N,2\r\n'
+
+def test_bad_ids_in_the_referenced_files_are_skipped(csv_dir, write_csv):
+    write_csv(csv_dir, 'title.csv', 'title_id,primary_title', ['tt0000001,A', 'nm0000002,B', 'ttX,C'])
+    results = check_integrity(csv_dir, 'report')
+    assert results['title_principal.csv'] == 4
+
+def test_failed_check_leaves_file_unchanged(csv_dir, monkeypatch):
+    fname = os.path.join(csv_dir, 'title_principal.csv')
+    orphan_fname = os.path.join(csv_dir, 'orphans.csv')
+    before = read(fname)
+    bitmaps = {'title.csv': bytearray(b'\xff')}
+
+    def fail(bitmap, id_string, prefix):
+        raise RuntimeError('check failed')
+    monkeypatch.setattr(integrity, 'in_bitmap', fail)
+    with pytest.raises(RuntimeError):
+        check_file(fname, [(0, 'title.csv')], bitmaps, 'quarantine', orphan_fname)
+
+    assert read(fname) == before
+    assert not os.path.exists(fname + '.checked')
+    assert not os.path.exists(orphan_fname)
@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+from imdb_data.extsort import sort_link_files
+from imdb_data.lookup import Lookup, build_indexes
+from imdb_data.server import route
+
+# Written the way the "process" module writes them - csv.writer, \r\n line
+# endings - with the link files deliberately not in key order.
+files = {
+    'title.csv': [
+        ['title_id', 'content_type_id', 'primary_title', 'original_title', 'is_adult', 'start_year', 'end_year', 'runtime_minutes'],
+        ['tt0000001', '2', 'Movie, The', 'Movie, The', '0', '1990', '\\N', '90'],
+        ['tt0000002', '3', 'Series', 'Series', '0', '2000', '2003', '\\N'],
+        ['tt0000003', '5', 'Episode 2.12', 'Episode 2.12', '0', '2001', '\\N', '30'],
+        ['tt0000004', '5', 'Episode 2.3', 'Episode 2.3', '0', '2001', '\\N', '30'],
+        ['tt0000005', '5', 'Episode 1.1', 'Episode 1.1', '0', '2000', '\\N', '30'],
+        ['tt0000006', '5', 'Episode 2.10', 'Episode 2.10', '0', '2001', '\\N', '30'],
+    ],
+    'talent.csv': [
+        ['talent_id', 'talent_name', 'birth_year', 'death_year'],
+        ['nm0000001', 'First Person', '1950', '\\N'],
+        ['nm0000002', 'Second Person', '1960', '\\N'],
+        ['nm0000003', 'Third Person', '1970', '\\N'],
+    ],
+    'title_principal.csv': [
+        ['title_id', 'talent_id', 'order', 'category_id', 'job', 'role_names'],
+        ['tt0000002', 'nm0000003', '2', '1', '\\N', 'Host'],
+        ['tt0000001', 'nm0000002', '10', '2', 'producer', '\\N'],
+        ['tt0000002', 'nm0000001', '1', '1', '\\N', 'Self, Guest'],
+        ['tt0000001', 'nm0000001', '2', '1', '\\N', 'Lead'],
+        ['tt0000001', 'nm0000003', '1', '3', 'director of photography', '\\N'],
+    ],
+    'talent_title.csv': [
+        ['talent_id', 'title_id'],
+        ['nm0000002', 'tt0000001'],
+        ['nm0000001', 'tt0000002'],
+    ],
+    'talent_role.csv': [
+        ['talent_id', 'role_id', 'order'],
+        ['nm0000002', '1', '1'],
+        ['nm0000001', '2', '1'],
+    ],
+    'title_episode.csv': [
+        ['title_id', 'parent_title_id', 'season_number', 'episode_number'],
+        ['tt0000003', 'tt0000002', '2', '12'],
+        ['tt0000004', 'tt0000002', '2', '3'],
+        ['tt0000005', 'tt0000002', '1', '1'],
+        ['tt0000006', 'tt0000002', '2', '10'],
+    ],
+}
+
+@pytest.fixture
+def csv_dir(tmp_path, write_csv):
+    for file_name, rows in files.items():
+        write_csv(tmp_path, file_name, rows[0], rows[1:])
+    return str(tmp_path)
+
+@pytest.fixture
+def lookup(csv_dir):
+    build_indexes(csv_dir)
+    lkp = Lookup(csv_dir)
+    yield lkp
+    lkp.close()
+
+# --------------------------------------------------------------------------
+
+def test_point_and_range_lookups(lookup):
+    assert lookup.title('tt0000001')['primary_title'] == 'Movie, The'
+    assert lookup.title('tt0000009') is None
+    assert lookup.talent('nm0000002')['talent_name'] == 'Second Person'
+    assert [row['title_id'] for row in lookup.title_range('tt0000002', 'tt0000004')] == \
+            ['tt0000002', 'tt0000003', 'tt0000004']
+    assert len(lookup.title_range('tt0000001', 'tt0000006', limit=2)) == 2
+
+def test_principals_in_order(lookup):
+    rows = lookup.principals('tt0000001')
+    assert [(row['talent_id'], row['order']) for row in rows] == \
+            [('nm0000003', '1'), ('nm0000001', '2'), ('nm0000002', '10')]
+    assert rows[1]['role_names'] == 'Lead'
+
+def test_filmography_in_title_order(lookup):
+    assert [row['title_id'] for row in lookup.filmography('nm0000001')] == ['tt0000001', 'tt0000002']
+
+def test_episodes_in_season_and_episode_order(lookup):
+    rows = lookup.episodes('tt0000002')
+    assert [(row['season_number'], row['episode_number']) for row in rows] == \
+            [('1', '1'), ('2', '3'), ('2', '10'), ('2', '12')]
+
+def test_ids_with_the_wrong_prefix_are_rejected(lookup):
+    for bad_id in ['nm0000001', 'tt', 'tt12x', '\\N']:
+        with pytest.raises(ValueError):
+            lookup.title(bad_id)
+    with pytest.raises(ValueError):
+        lookup.talent('tt0000001')
+    with pytest.raises(ValueError):
+        route(lookup, '/title/nm0000001', {})
+
+def test_range_limit_below_one_is_rejected(lookup):
+    for limit in ['0', '-1', 'x']:
+        with pytest.raises(ValueError):
+            route(lookup, '/titles', {'from': ['tt0000001'], 'to': ['tt0000006'], 'limit': [limit]})
+    assert len(route(lookup, '/titles', {'from': ['tt0000001'], 'to': ['tt0000006'], 'limit': ['1']})) == 1
+
+# --------------------------------------------------------------------------
+
+def test_index_is_refused_after_sort_and_correct_once_rebuilt(csv_dir):
+    build_indexes(csv_dir)
+    size = os.path.getsize(os.path.join(csv_dir, 'title_principal.csv'))
+    sort_link_files(csv_dir, workers=1)
+    # the same size, but in a different order:
+    assert os.path.getsize(os.path.join(csv_dir, 'title_principal.csv')) == size
+    with pytest.raises(ValueError, match='out of date'):
+        Lookup(csv_dir)
+
+    build_indexes(csv_dir)
+    lkp = Lookup(csv_dir)
+    try:
+        assert [row['order'] for row in lkp.principals('tt0000001')] == ['1', '2', '10']
+        assert {row['title_id'] for row in lkp.principals('tt0000002')} == {'tt0000002'}
+    finally:
+        lkp.close()
@@ -0,0 +1,118 @@
+import csv
+import io
+import os
+
+import pytest
+
+from imdb_data import process
+from imdb_data.process import normalize_title_akas, normalize_title_principals
+
+def write_tsv(src_dir, file_name, lines):
+    with io.open(os.path.join(src_dir, file_name), mode='w', encoding='utf-8', newline='') as out_f:
+        out_f.writelines(line + '\n' for line in lines)
+
+def read_csv(fname):
+    with io.open(fname, mode='r', encoding='utf-8', newline='') as in_f:
+        return list(csv.reader(in_f))
+
+@pytest.fixture
+def src_dir(tmp_path):
+    write_tsv(tmp_path, 'title_akas.tsv', [
+        'titleId\tordering\ttitle\tregion\tlanguage\ttypes\tattributes\tisOriginalTitle',
+        'tt0000001\t1\tEins\tDE\tde\t\\N\t\\N\t0',
+        'tt0000001\t2\tOne\tUS\ten\timdbDisplay\tliteral title\x02short version\t0',
+        'tt0000002\t1\tZwei\tDE\t\\N\t\\N\tshort version\t1',
+        'tt0000002\t2\tTwo\tUS\t\\N\t\\N\tliteral title\x02short version\t0',
+    ])
+    # not tab-separated - the fields are separated by (at least 2) spaces:
+    write_tsv(tmp_path, 'title_principals.tsv', [
+        'tconst  ordering  nconst  category  job  characters',
+        'tt0000001  1  nm0000001  director  \\N  \\N',
+        'tt0000001  2  nm0000002  cinematographer  director of photography  \\N',
+        'tt0000002  1  nm0000002  writer  novel  \\N',
+        'tt0000002  2  nm0000001  cinematographer  director of photography  \\N',
+    ])
+    return str(tmp_path)
+
+# --------------------------------------------------------------------------
+
+def test_encoded_jobs(src_dir):
+    out_dir = os.path.join(src_dir, 'csv')
+    normalize_title_principals(src_dir, out_dir, encode_text=True)
+
+    # IDs in the order the values are first seen, with no entry for \N:
+    assert read_csv(os.path.join(out_dir, 'job.csv')) == \
+            [['job_id', 'job_name'], ['1', 'director of photography'], ['2', 'novel']]
+    rows = read_csv(os.path.join(out_dir, 'title_principal.csv'))
+    assert rows[0] == ['title_id', 'talent_id', 'order', 'category_id', 'job_id', 'role_names']
+    assert [row[4] for row in rows[1:]] == ['\\N', '1', '2', '1']
+
+def test_encoded_additional_attrs(src_dir):
+    out_dir = os.path.join(src_dir, 'csv')
+    normalize_title_akas(src_dir, out_dir, encode_text=True)
+
+    assert read_csv(os.path.join(out_dir, 'additional_attrs.csv')) == \
+            [['additional_attrs_id', 'additional_attrs_name'],
+            ['1', 'literal title, short version'], ['2', 'short version']]
+    rows = read_csv(os.path.join(out_dir, 'title_aka.csv'))
+    assert rows[0] == ['title_id', 'order', 'aka_title', 'region', 'language',
+            'additional_attrs_id', 'is_original_title']
+    assert [row[5] for row in rows[1:]] == ['\\N', '1', '2', '1']
+
+def test_unencoded_run_removes_old_master_files(src_dir):
+    out_dir = os.path.join(src_dir, 'csv')
+    normalize_title_principals(src_dir, out_dir, encode_text=True)
+    normalize_title_akas(src_dir, out_dir, encode_text=True)
+    normalize_title_principals(src_dir, out_dir)
+    normalize_title_akas(src_dir, out_dir)
+
+    assert not os.path.exists(os.path.join(out_dir, 'job.csv'))
+    assert not os.path.exists(os.path.join(out_dir, 'additional_attrs.csv'))
+    assert read_csv(os.path.join(out_dir, 'title_principal.csv'))[2][4] == 'director of photography'
+    assert read_csv(os.path.join(out_dir, 'title_aka.csv'))[2][5] == 'literal title, short version'
+
+# --------------------------------------------------------------------------
+
+# Replaces every stage with one which records its name and arguments.
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+    def recorder(name):
+        return lambda *args: calls.append((name,) + args)
+    monkeypatch.setattr(process, 'stages', {name: recorder(name) for name in process.stages})
+    return calls
+
+def test_unknown_stage_is_rejected(calls):
+    with pytest.raises(ValueError, match='no_such_stage'):
+        process.run('src', 'out', ['title_basics', 'no_such_stage'])
+    assert calls == []
+
+def test_unknown_integrity_action_is_rejected(calls):
+    with pytest.raises(ValueError, match='bogus'):
+        process.run('src', 'out', ['check_integrity'], integrity_action='bogus')
+    assert calls == []
+
+def test_default_stages(calls):
+    process.run('src', 'out')
+    assert [call[0] for call in calls] == process.default_stages
+
+def test_stages_run_in_pipeline_order(calls):
+    process.run('src', 'out', ['build_index', 'title_basics', 'sort_links', 'unzip'])
+    assert [call[0] for call in calls] == ['unzip', 'title_basics', 'sort_links', 'build_index']
+
+def test_options_reach_only_their_own_stages(calls):
+    process.run('src', 'out', ['check_integrity', 'title_principals', 'name_basics', 'title_akas'],
+            encode_text=True, integrity_action='drop')
+    assert calls == [
+        ('name_basics', 'src', 'out'),
+        ('title_akas', 'src', 'out', True),
+        ('title_principals', 'src', 'out', True),
+        ('check_integrity', 'src', 'out', 'drop'),
+    ]
+
+def test_integrity_stage_passes_its_action(monkeypatch):
+    checks = []
+    monkeypatch.setattr(process, 'check_integrity', lambda *args: checks.append(args))
+    process.run('src', 'out', ['check_integrity'], integrity_action='quarantine')
+    process.run('src', 'out', ['check_integrity'])
+    assert checks == [('out', 'quarantine'), ('out', 'report')]
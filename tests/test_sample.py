@@ -0,0 +1,59 @@
+import io
+import os
+
+import pytest
+
+from imdb_data.sample import ref_files, sample_sizes
+
+title_count = 3000
+
+@pytest.fixture
+def csv_dir(tmp_path, write_csv):
+    title_ids = ['tt%07d' % n for n in range(1, title_count + 1)]
+    write_csv(tmp_path, 'title.csv', 'title_id,content_type_id,primary_title,original_title,is_adult,start_year,end_year,runtime_minutes',
+            [title_id + ',2,A Title,A Title,0,2000,\\N,90' for title_id in title_ids])
+    write_csv(tmp_path, 'talent.csv', 'talent_id,talent_name,birth_year,death_year', ['nm0000001,Someone,1950,\\N'])
+    write_csv(tmp_path, 'talent_title.csv', 'talent_id,title_id', ['nm0000001,' + title_id for title_id in title_ids[::7]])
+    write_csv(tmp_path, 'title_principal.csv', 'title_id,talent_id,order,category_id,job,role_names',
+            [title_id + ',nm0000001,1,1,\\N,\\N' for title_id in title_ids[::5]])
+    write_csv(tmp_path, 'talent_role.csv', 'talent_id,role_id,order', ['nm0000001,1,1'])
+    for file_name in ['title_aka.csv', 'title_aka_title_type.csv', 'title_genre.csv']:
+        write_csv(tmp_path, file_name, 'title_id,x,order', [title_id + ',1,1' for title_id in title_ids[::3]])
+    write_csv(tmp_path, 'title_episode.csv', 'title_id,parent_title_id,season_number,episode_number', [])
+    for file in ref_files:
+        write_csv(tmp_path, file + '.csv', file + '_id,' + file + '_name', ['1,one'])
+    return str(tmp_path)
+
+def read_lines(fname):
+    with io.open(fname, mode='r', encoding='utf-8') as in_f:
+        return set(in_f)
+
+def test_nested_samples_are_subsets_and_close_to_size(csv_dir):
+    out_dir = os.path.join(csv_dir, 'sampled')
+    sizes = [1000, 700, 600, 100]
+    sample_sizes(csv_dir, out_dir, sizes)
+
+    for file_name in ['title.csv', 'talent_title.csv', 'title_principal.csv', 'title_aka.csv']:
+        samples = [read_lines(os.path.join(out_dir, str(size), file_name)) for size in sizes]
+        for larger, smaller in zip(samples, samples[1:]):
+            assert smaller <= larger
+
+    for size in sizes:
+        titles = len(read_lines(os.path.join(out_dir, str(size), 'title.csv'))) - 1
+        assert abs(titles - size) <= 4 * size ** 0.5
+
+def test_sample_sizes_below_one_are_rejected(csv_dir):
+    with pytest.raises(ValueError):
+        sample_sizes(csv_dir, os.path.join(csv_dir, 'sampled'), [100, 0])
+
+def test_master_files_copied_only_for_encoded_links(csv_dir, write_csv):
+    # left behind by an earlier encoded run - title_principal.csv has a job column:
+    write_csv(csv_dir, 'job.csv', 'job_id,job_name', ['1,producer'])
+    out_dir = os.path.join(csv_dir, 'sampled')
+    sample_sizes(csv_dir, out_dir, [100])
+    assert not os.path.exists(os.path.join(out_dir, '100', 'job.csv'))
+
+    write_csv(csv_dir, 'title_principal.csv', 'title_id,talent_id,order,category_id,job_id,role_names',
+            ['tt0000001,nm0000001,1,1,1,\\N'])
+    sample_sizes(csv_dir, out_dir, [100])
+    assert os.path.exists(os.path.join(out_dir, '100', 'job.csv'))